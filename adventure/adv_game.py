@@ -27,31 +27,49 @@ sense_exp = [
 ]
 
 import random
-from typing import Iterable, List, Optional, Any
+import sys
+from typing import Iterable, List, Optional, Any, Tuple
 
 class RandomItemSelector:
     """
     RandomItemSelector manages a pool of items and tracks which have been used.
-    - items: original list of items
+    - items: read-only view of the pool; change it through add_item or init
     - used_items: list of items already selected (preserves selection order)
+    - _order: shuffled copy of items; entries before _cursor have been drawn
     """
 
     def __init__(self, items: Optional[Iterable[Any]] = None):
-        self.items: List[Any] = list(items) if items is not None else []
+        self._items: List[Any] = list(items) if items is not None else []
         self.used_items: List[Any] = []
+        self._order: List[Any] = list(self._items)
+        random.shuffle(self._order)
+        self._cursor = 0
+
+    @property
+    def items(self) -> Tuple[Any, ...]:
+        """
+        The current pool of items, as an immutable snapshot.
+        """
+        return tuple(self._items)
 
     # literal init alias (per spec) that re-initializes the selector
     def init(self, items: Optional[Iterable[Any]] = None) -> None:
         """
         Reinitialize the selector with a new collection of items.
+        Existing lists are refilled in place rather than reallocated.
         """
-        self.__init__(items)
+        # Slice assignment reads all of items before replacing the contents,
+        # so iterables built over the current pool are handled safely.
+        self._items[:] = items if items is not None else ()
+        self.reset()
 
     def add_item(self, item: Any) -> None:
         """
         Add a single item to the available items list.
         """
-        self.items.append(item)
+        self._items.append(item)
+        # Slot the new item at a random position among the undrawn entries.
+        self._order.insert(random.randrange(self._cursor, len(self._order) + 1), item)
 
     def pull_random_item(self) -> Optional[Any]:
         """
@@ -59,20 +77,17 @@ class RandomItemSelector:
         - If all items have been used, reset used_items and continue.
         - If there are no items at all, clear used_items and return None.
         """
-        if not self.items:
+        if not self._items:
             # No items to select; ensure used_items is cleared and signal absence.
-            self.used_items.clear()
+            self.reset()
             return None
 
-        # Determine available items (those not in used_items)
-        available = [itm for itm in self.items if itm not in self.used_items]
-
-        if not available:
+        if self._cursor >= len(self._order):
             # All items used — reset and make all available again.
             self.reset()
-            available = list(self.items)
 
-        choice = random.choice(available)
+        choice = self._order[self._cursor]
+        self._cursor += 1
         self.used_items.append(choice)
         return choice
 
@@ -81,93 +96,75 @@ class RandomItemSelector:
         Clear used_items to make all items available again.
         """
         self.used_items.clear()
+        self._order[:] = self._items
+        random.shuffle(self._order)
+        self._cursor = 0
 
 from typing import Dict
 
-class SenseClueGenerator:
+# Every clue/sense pairing, joined once at import (row-major by clue).
+_COMBINED = tuple(f"{c} {s}" for c in clues for s in sense_exp)
+
+class _SenseClueGen:
     """
-    Singleton generator that combines a clue and a sensory experience.
+    Generator that combines a clue and a sensory experience.
     Initializes two RandomItemSelector instances for clues and senses.
+    Use the module-level sense_clue_generator rather than instantiating this.
     """
 
-    _instance = None
-
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            # Initialize selectors with the module-level lists
-            cls._instance.clue_selector = RandomItemSelector(clues)
-            cls._instance.sense_selector = RandomItemSelector(sense_exp)
-        return cls._instance
+    def __init__(self):
+        # Selectors draw indices so each pull maps straight into _COMBINED.
+        self.clue_selector = RandomItemSelector(range(len(clues)))
+        self.sense_selector = RandomItemSelector(range(len(sense_exp)))
 
     def get_senseclue(self) -> str:
         """
-        Pull one clue and one sensory experience and combine them into a single string.
+        Pull one clue and one sensory experience and return their combined string.
         """
-        clue = self.clue_selector.pull_random_item()
-        sense = self.sense_selector.pull_random_item()
-
-        if clue and sense:
-            return f"{clue} {sense}"
-        if clue:
-            return clue
-        if sense:
-            return sense
-        return ""
-    
+        clue_idx = self.clue_selector.pull_random_item()
+        sense_idx = self.sense_selector.pull_random_item()
+        return _COMBINED[clue_idx * len(sense_exp) + sense_idx]
+
+# The module is the singleton: share this one generator everywhere.
+sense_clue_generator = _SenseClueGen()
+
 from enum import Enum
 
 class encounter_outcome(Enum):
     CONTINUE = "CONTINUE"
     END = "END"
 
-from abc import ABC, abstractmethod
-
 # Provide a convenient type name matching the requested "EncounterOutcome"
 EncounterOutcome = encounter_outcome
 
-class Encounter(ABC):
+class Encounter:
     """
-    Abstract base class for encounters.
+    Base class for encounters.
     Subclasses must implement run_encounter and return an EncounterOutcome.
     """
 
-    @abstractmethod
     def run_encounter(self) -> EncounterOutcome:
         """
         Execute the encounter and return an EncounterOutcome.
+        Subclasses must override; the base implementation raises NotImplementedError.
         """
-        pass
+        raise NotImplementedError
 
 class DefaultEncounter(Encounter):
     """
-    Default encounter that uses SenseClueGenerator to produce output.
+    Default encounter that uses sense_clue_generator to produce output.
     """
 
-    def __init__(self):
-        # instantiate the singleton generator
-        self.generator = SenseClueGenerator()
+    # shared module-level generator, bound once at class creation
+    generator = sense_clue_generator
 
     def run_encounter(self) -> EncounterOutcome:
         """
-        Attempt to call pull_random_item on the generator if available;
-        otherwise combine a clue and a sense from the generator's selectors.
-        Print the result and continue the encounter.
+        Print a combined clue and sense from the generator and continue the encounter.
         """
-        pull = getattr(self.generator, "pull_random_item", None)
-        if callable(pull):
-            output = pull()
-        else:
-            # fallback: use the underlying selectors to produce a combined string
-            clue = self.generator.clue_selector.pull_random_item()
-            sense = self.generator.sense_selector.pull_random_item()
-            if clue and sense:
-                output = f"{clue} {sense}"
-            else:
-                output = clue or sense or ""
-        print(output)
+        print(self.generator.get_senseclue())
         return EncounterOutcome.CONTINUE
-    
+
 class Room:
     """
     A room with a name and an Encounter. visit_room runs the encounter and
@@ -182,23 +179,30 @@ class Room:
         return self.encounter.run_encounter()
 
 
-rooms = [
-    Room("Throne Room", DefaultEncounter()),
-    Room("Armory", DefaultEncounter()),
-    Room("Library", DefaultEncounter()),
-    Room("Great Hall", DefaultEncounter()),
-    Room("Solar", DefaultEncounter()),
-    Room("Dungeon", DefaultEncounter()),
-]
+_ROOM_NAMES = ("Throne Room", "Armory", "Library", "Great Hall", "Solar", "Dungeon")
+
+# DefaultEncounter holds no per-instance state, so every room shares one.
+_DEFAULT_ENCOUNTER = DefaultEncounter()
+
+rooms = [Room(name, _DEFAULT_ENCOUNTER) for name in _ROOM_NAMES]
+
+# Separator lines used around door and room output
+_BANNER_EQ = "=" * 40
+_BANNER_DASH = "-" * 40
+
+# Valid door choices keyed by the number of doors offered (2-4)
+_VALID_DOORS = {n: frozenset(range(1, n + 1)) for n in range(2, 5)}
 
 class Castle:
     """
     Castle manages room selection and navigation.
     """
 
-    def __init__(self, rooms=None):
-        # Accept an explicit collection of rooms or fall back to the module-level 'rooms'
-        rooms_list = list(rooms) if rooms is not None else globals().get("rooms", [])
+    def __init__(self, rooms=None, _default_rooms=rooms):
+        # Accept an explicit collection of rooms or fall back to the module-level 'rooms',
+        # bound at definition time. RandomItemSelector copies its input, so no list()
+        # copy is needed here.
+        rooms_list = rooms if rooms is not None else _default_rooms
         self.room_selector = RandomItemSelector(rooms_list)
 
     def select_door(self) -> int:
@@ -207,16 +211,17 @@ class Castle:
         validate input, and return the chosen door index (1-based).
         """
         num_doors = random.randint(2, 4)
-        print("\n" + "=" * 40)
-        print(f"There are {num_doors} doors before you.")
+        # Emit the banner in a single write rather than one print per line.
+        sys.stdout.write(f"\n{_BANNER_EQ}\nThere are {num_doors} doors before you.\n")
         prompt = f"Choose a door (1-{num_doors}): "
+        valid = _VALID_DOORS[num_doors]
 
         while True:
             try:
                 choice_str = input(prompt).strip()
                 choice = int(choice_str)
-                if 1 <= choice <= num_doors:
-                    print(f"You open door {choice}.\n" + "-" * 40)
+                if choice in valid:
+                    print(f"You open door {choice}.\n{_BANNER_DASH}")
                     return choice
                 else:
                     print(f"Invalid selection: enter a number between 1 and {num_doors}.")
@@ -238,7 +243,7 @@ class Castle:
 
         print(f"You step through and enter: {room.name}")
         result = room.visit_room()
-        print("=" * 40 + "\n")
+        print(_BANNER_EQ, end="\n\n")
         return result
 
     def reset(self) -> None:
@@ -248,6 +253,10 @@ class Castle:
         self.room_selector.reset()
         print("Room selector has been reset; all rooms are available again.")
 
+# Accepted answers for the restart prompt
+_YES = frozenset({"y", "yes"})
+_NO = frozenset({"n", "no"})
+
 class Game:
     """
     Game orchestrates gameplay: explaining objectives, running the main loop,
@@ -266,19 +275,21 @@ class Game:
         """
         print("\nWelcome, adventurer.")
         print("Objective: Navigate through the castle's doors and seek the hidden treasure.\n")
+        # Bind the per-iteration call once so the loop body uses a fast local.
+        next_room = self.castle.next_room
         try:
             while True:
-                outcome = self.castle.next_room()
+                outcome = next_room()
                 if outcome == EncounterOutcome.END:
                     # Encounter signaled the end — reset and offer to restart or exit
                     self.castle.reset()
                     print("\nGame Over\n")
                     while True:
                         choice = input("Would you like to explore a different castle? (y/n): ").strip().lower()
-                        if choice in ("y", "yes"):
+                        if choice in _YES:
                             print("\nA new exploration begins...\n")
                             break  # restart loop
-                        if choice in ("n", "no"):
+                        if choice in _NO:
                             print("\nFarewell, adventurer.")
                             return
                         print("Please respond with 'y' or 'n'.")